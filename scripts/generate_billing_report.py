@@ -5,8 +5,7 @@
 #   "reportlab",
 #   "matplotlib", 
 #   "requests",
-#   "pillow",
-#   "pytz"
+#   "pillow"
 # ]
 # ///
 
@@ -15,287 +14,465 @@ Linode Infrastructure Billing Report Generator
 This script generates a comprehensive PDF billing report for Linode infrastructure,
 including cost analysis, resource inventory, and visual diagrams.
 
-Usage: uv run generate_billing_report.py
+Usage: uv run generate_billing_report.py [--no-cache] [--skip-charts]
 """
 
+import argparse
+import configparser
+import hashlib
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import os
 import sys
+import time
+from collections import Counter
+from itertools import chain
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 import tempfile
 import base64
 
-# PDF generation
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch, cm
-from reportlab.lib.colors import Color, HexColor
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
-from reportlab.platypus.tableofcontents import TableOfContents
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
+if TYPE_CHECKING:
+    from reportlab.graphics.shapes import Drawing
+    from reportlab.platypus import TableStyle
 
-# Charts and diagrams
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch
-import numpy as np
+# Linode API access
+import requests
+from requests.adapters import HTTPAdapter
+
+LINODE_API_URL = "https://api.linode.com/v4"
+
+# Monthly cost per instance type
+_COST_MAP = {
+    "g6-nanode-1": 5.00,
+    "g6-standard-1": 12.00,
+    "g6-standard-2": 24.00,
+    "g6-standard-4": 48.00,
+    "g6-standard-6": 96.00,
+    "g6-standard-8": 192.00,
+    "g6-standard-16": 384.00,
+    "g6-standard-20": 480.00,
+    "g6-standard-24": 576.00,
+    "g6-standard-32": 768.00,
+}
+_DEFAULT_COST = 24.00  # Default to standard-2
+
+# matplotlib's Set3 palette, used for the resource distribution chart
+_SET3 = ('#8dd3c7', '#ffffb3', '#bebada', '#fb8072', '#80b1d3', '#fdb462',
+         '#b3de69', '#fccde5', '#d9d9d9', '#bc80bd', '#ccebc5', '#ffed6f')
+
+# Table directives shared by every table in the report
+_BASE_TABLE_STYLE_CMDS = (
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('GRID', (0, 0), (-1, -1), 1, 'black'),
+)
+
+# linode-cli responses are cached on disk for this many seconds
+# (override with BILLING_CACHE_TTL)
+CACHE_TTL_SECONDS = 300
+
+# Rendered charts are kept for reuse until unused for this many days
+CHART_MAX_AGE_DAYS = 7
+
+
+def _env_flag(name: str) -> bool:
+    """Return True if an environment variable is set to 1, true or yes."""
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes")
+
+
+def _pyplot():
+    """Import matplotlib's pyplot on first use; later calls hit sys.modules."""
+    import matplotlib
+    # Charts are only written to files, so skip loading any GUI backend
+    matplotlib.use("Agg")
+    matplotlib.rcParams["path.simplify"] = True
+    matplotlib.rcParams["path.simplify_threshold"] = 1.0
+    matplotlib.rcParams["agg.path.chunksize"] = 10000
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _make_table_style(header_bg, body_bg, *extra_cmds) -> "TableStyle":
+    """Build a table style from the shared directives plus per-table colors."""
+    from reportlab.platypus import TableStyle
+
+    return TableStyle([
+        *_BASE_TABLE_STYLE_CMDS,
+        ('BACKGROUND', (0, 0), (-1, 0), header_bg),
+        ('TEXTCOLOR', (0, 0), (-1, 0), 'white'),
+        ('BACKGROUND', (0, 1), (-1, -1), body_bg),
+        *extra_cmds,
+    ])
+
+
+def instance_cost(instance_type: str) -> float:
+    """Get monthly cost for instance type."""
+    return _COST_MAP.get(instance_type, _DEFAULT_COST)
 
-# Time handling
-import pytz
 
 class LinodeBillingReport:
-    def __init__(self):
+    def __init__(self, use_cache: bool = True, skip_charts: bool = False):
         self.report_dir = Path("./reports")
         self.report_dir.mkdir(exist_ok=True)
         self.pdf_file = self.report_dir / "bill.pdf"
+        self.cache_dir = self.report_dir / ".cli_cache"
+        self.use_cache = use_cache and not _env_flag("BILLING_NO_CACHE")
+        try:
+            self.cache_ttl = int(os.environ.get("BILLING_CACHE_TTL", CACHE_TTL_SECONDS))
+        except ValueError:
+            print(f"Warning: Invalid BILLING_CACHE_TTL, using {CACHE_TTL_SECONDS}s")
+            self.cache_ttl = CACHE_TTL_SECONDS
+        self.skip_charts = skip_charts or _env_flag("BILLING_SKIP_CHARTS")
         self.timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        self.report_date_str = datetime.now(timezone.utc).astimezone().strftime('%B %d, %Y at %H:%M %Z')
         
         # Styling
-        self.primary_color = HexColor("#00A651")  # Linode green
-        self.secondary_color = HexColor("#1976D2")  # Blue
-        self.accent_color = HexColor("#FF6B35")   # Orange
-        self.gray_color = HexColor("#666666")
-        
+        self.primary_color = "#00A651"  # Linode green
+        self.secondary_color = "#1976D2"  # Blue
+        self.accent_color = "#FF6B35"   # Orange
+        self.gray_color = "#666666"
+        
+        # Direct API access, used when a token is available. Cached responses
+        # are keyed by the credentials so switching accounts never serves
+        # another account's data.
+        token = self._read_api_token()
+        identity = "\0".join([os.environ.get("LINODE_CLI_TOKEN", ""), token or ""])
+        self.cache_identity = hashlib.blake2b(identity.encode(), digest_size=16).hexdigest()
+        self.session = self._create_api_session(token)
+
         # Data storage
         self.account_info = {}
         self.linodes = []
         self.lke_clusters = []
-        
+
+        # Cost aggregates, filled in by _compute_totals()
+        self.linode_type_counts = Counter()
+        self.linode_monthly = 0.0
+        self.lke_worker_monthly = 0.0
+        self.total_monthly = 0.0
+        
+    def _cache_file(self, command: List[str]) -> Path:
+        """Return the cache file path for a linode-cli command."""
+        key = hashlib.blake2b("\0".join([self.cache_identity, *command]).encode(),
+                              digest_size=16).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def _read_cache(self, command: List[str]) -> Optional[Dict]:
+        """Return the cached result for a command if it is still fresh."""
+        cache_file = self._cache_file(command)
+        try:
+            if time.time() - cache_file.stat().st_mtime > self.cache_ttl:
+                return None
+            with cache_file.open() as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _write_cache(self, command: List[str], data: Dict):
+        """Atomically write a command result to the cache."""
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self._cache_file(command))
+        except OSError as e:
+            print(f"Warning: Failed to cache linode-cli {' '.join(command)}: {e}")
+
     def run_linode_cli(self, command: List[str]) -> Optional[Dict]:
-        """Run linode-cli command and return JSON result."""
+        """Run linode-cli command and return JSON result, served from cache when fresh."""
+        if self.use_cache:
+            cached = self._read_cache(command)
+            if cached is not None:
+                return cached
+
         try:
             cmd = ["linode-cli"] + command + ["--json"]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            # Keep stdout as bytes; json.loads parses them without a decoded str copy
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=30)
             if result.returncode == 0 and result.stdout.strip():
                 data = json.loads(result.stdout)
-                return data if isinstance(data, list) and data else None
+                if isinstance(data, list) and data:
+                    self._write_cache(command, data)
+                    return data
             return None
         except (subprocess.TimeoutExpired, json.JSONDecodeError, Exception) as e:
             print(f"Warning: Failed to run linode-cli {' '.join(command)}: {e}")
             return None
 
+    def _read_api_token(self) -> Optional[str]:
+        """Find a Linode API token in LINODE_TOKEN or the linode-cli config."""
+        token = os.environ.get("LINODE_TOKEN")
+        if token:
+            return token
+
+        config = configparser.ConfigParser()
+        try:
+            if not config.read(Path.home() / ".config" / "linode-cli"):
+                return None
+        except configparser.Error:
+            return None
+        user = config.defaults().get("default-user")
+        if user and config.has_section(user):
+            return config.get(user, "token", fallback=None)
+        return config.defaults().get("token")
+
+    def _create_api_session(self, token: Optional[str]) -> Optional[requests.Session]:
+        """Create a keep-alive session for the Linode API, or None without a token."""
+        if not token:
+            return None
+        session = requests.Session()
+        session.headers.update({"Authorization": f"Bearer {token}"})
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        session.mount("https://", adapter)
+        return session
+
+    def fetch_cluster_pools(self, cluster_id: int) -> Optional[List[Dict]]:
+        """Fetch node pools for a cluster via the API, falling back to linode-cli."""
+        command = ["lke", "pools-list", str(cluster_id)]
+        if self.session is None:
+            return self.run_linode_cli(command)
+
+        if self.use_cache:
+            cached = self._read_cache(command)
+            if cached is not None:
+                return cached
+
+        try:
+            pools = []
+            page, pages = 1, 1
+            while page <= pages:
+                response = self.session.get(
+                    f"{LINODE_API_URL}/lke/clusters/{cluster_id}/pools",
+                    params={"page": page}, timeout=30)
+                response.raise_for_status()
+                body = response.json()
+                pools.extend(body.get("data", []))
+                pages = body.get("pages", 1)
+                page += 1
+        except (requests.RequestException, ValueError) as e:
+            print(f"Warning: Failed to fetch node pools for cluster {cluster_id}: {e}")
+            return self.run_linode_cli(command)
+
+        if pools:
+            self._write_cache(command, pools)
+        return pools or None
+
     def collect_data(self):
         """Collect billing and resource data from Linode CLI."""
-        print("📊 Collecting account information...")
-        account_data = self.run_linode_cli(["account", "view"])
-        if account_data:
-            self.account_info = account_data[0]
-        
-        print("🖥️ Collecting compute resources...")
-        linodes_data = self.run_linode_cli(["linodes", "list"])
-        if linodes_data:
-            self.linodes = linodes_data
-            
-        print("☸️ Collecting Kubernetes clusters...")
-        lke_data = self.run_linode_cli(["lke", "clusters-list"])
-        if lke_data:
-            self.lke_clusters = lke_data
-            
-        # Get node pools for each cluster
-        for cluster in self.lke_clusters:
-            cluster_id = cluster.get('id')
-            if cluster_id:
-                pools = self.run_linode_cli(["lke", "pools-list", str(cluster_id)])
-                cluster['pools'] = pools or []
-
-    def get_instance_cost(self, instance_type: str) -> float:
-        """Get monthly cost for instance type."""
-        cost_map = {
-            "g6-nanode-1": 5.00,
-            "g6-standard-1": 12.00,
-            "g6-standard-2": 24.00,
-            "g6-standard-4": 48.00,
-            "g6-standard-6": 96.00,
-            "g6-standard-8": 192.00,
-            "g6-standard-16": 384.00,
-            "g6-standard-20": 480.00,
-            "g6-standard-24": 576.00,
-            "g6-standard-32": 768.00,
-        }
-        return cost_map.get(instance_type, 24.00)  # Default to standard-2
-
-    def create_cost_structure_diagram(self) -> str:
-        """Create a visual cost structure diagram showing only used components."""
-        fig, ax = plt.subplots(figsize=(12, 8))
-        ax.set_xlim(0, 10)
-        ax.set_ylim(0, 8)
-        ax.axis('off')
-        
+        print("📊 Collecting account, compute and Kubernetes data...")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            account_future = executor.submit(self.run_linode_cli, ["account", "view"])
+            linodes_future = executor.submit(self.run_linode_cli, ["linodes", "list"])
+            lke_future = executor.submit(self.run_linode_cli, ["lke", "clusters-list"])
+
+            account_data = account_future.result()
+            if account_data:
+                self.account_info = account_data[0]
+
+            linodes_data = linodes_future.result()
+            if linodes_data:
+                self.linodes = linodes_data
+
+            lke_data = lke_future.result()
+            if lke_data:
+                self.lke_clusters = lke_data
+
+            # Get node pools for each cluster
+            print("☸️ Collecting node pools...")
+            clusters_by_id = {
+                cluster['id']: cluster for cluster in self.lke_clusters if cluster.get('id')
+            }
+            pool_futures = {
+                executor.submit(self.fetch_cluster_pools, cluster_id): cluster_id
+                for cluster_id in clusters_by_id
+            }
+            for future in as_completed(pool_futures):
+                clusters_by_id[pool_futures[future]]['pools'] = future.result() or []
+
+        self._compute_totals()
+
+    def _compute_totals(self):
+        """Aggregate instance counts and monthly costs in a single pass."""
+        self.linode_type_counts = Counter(
+            linode.get('type', 'Unknown') for linode in self.linodes)
+        self.linode_monthly = sum(
+            instance_cost(instance_type) * count
+            for instance_type, count in self.linode_type_counts.items())
+        self.lke_worker_monthly = sum(
+            instance_cost(pool.get('type', 'g6-standard-2')) * pool.get('count', 0)
+            for cluster in self.lke_clusters
+            for pool in cluster.get('pools', []))
+        self.total_monthly = self.linode_monthly + self.lke_worker_monthly
+
+    def _build_cost_drawing(self) -> Optional["Drawing"]:
+        """Build the cost structure diagram as native reportlab vector graphics."""
+        if not self.linodes and not self.lke_clusters:
+            return None
+
+        from reportlab.graphics.shapes import Drawing, Rect, String
+        from reportlab.lib import colors
+        from reportlab.lib.colors import HexColor
+        from reportlab.lib.units import inch
+
+        width, height = 6*inch, 4*inch
+        drawing = Drawing(width, height)
+
+        # Layout is expressed on a 10 x 8 grid and scaled to the drawing size
+        sx, sy = width / 10, height / 8
+
+        def box(x, y, w, h, fill, stroke, stroke_width=1, radius=6):
+            drawing.add(Rect(x*sx, y*sy, w*sx, h*sy, rx=radius, ry=radius,
+                             fillColor=fill, strokeColor=stroke, strokeWidth=stroke_width))
+
+        def text(x, y, value, size, bold=False, color=colors.black, italic=False):
+            font = "Helvetica-Bold" if bold else "Helvetica-Oblique" if italic else "Helvetica"
+            drawing.add(String(x*sx, y*sy, value, fontName=font, fontSize=size,
+                               fillColor=color, textAnchor='middle'))
+
         # Colors
-        primary = '#00A651'
-        secondary = '#1976D2'
-        accent = '#FF6B35'
-        
+        primary = HexColor(self.primary_color)
+        secondary = HexColor(self.secondary_color)
+        accent = HexColor(self.accent_color)
+
         # Main title
-        ax.text(5, 7.5, 'Current Month Cost Breakdown', fontsize=20, fontweight='bold', 
-                ha='center', color=primary)
-        
+        text(5, 7.5, 'Current Month Cost Breakdown', 14, bold=True, color=primary)
+
         # Account overview box
         balance = self.account_info.get('balance', 0)
         uninvoiced = self.account_info.get('balance_uninvoiced', 0)
         total = float(balance) + float(uninvoiced)
-        
-        account_box = FancyBboxPatch((0.5, 5.5), 9, 1.5, 
-                                   boxstyle="round,pad=0.1", 
-                                   facecolor='lightblue', 
-                                   edgecolor=secondary, linewidth=2)
-        ax.add_patch(account_box)
-        
-        ax.text(5, 6.5, f'Current Month Usage: ${uninvoiced}', fontsize=14, fontweight='bold', ha='center')
-        ax.text(3, 6, f'Balance: ${balance}', fontsize=12, ha='center')
-        ax.text(7, 6, f'Total Due: ${total:.2f}', fontsize=12, ha='center', fontweight='bold')
-        
+
+        box(0.5, 5.5, 9, 1.5, colors.lightblue, secondary, stroke_width=2)
+        text(5, 6.5, f'Current Month Usage: ${uninvoiced}', 10, bold=True)
+        text(3, 5.9, f'Balance: ${balance}', 9)
+        text(7, 5.9, f'Total Due: ${total:.2f}', 9, bold=True)
+
         # Only show categories that have active resources
         used_categories = []
         x_positions = []
-        
-        # Check what's actually being used
+
         if self.linodes:
-            used_categories.append(('Compute Resources', '#FFE0E0'))
-            
+            used_categories.append(('Compute Resources', HexColor('#FFE0E0')))
+
         if self.lke_clusters:
-            used_categories.append(('Kubernetes (LKE)', '#E0F0FF'))
-            
-        # For now, we'll assume storage and networking are not actively tracked
-        # but could be added if we had that data from CLI
-        
+            used_categories.append(('Kubernetes (LKE)', HexColor('#E0F0FF')))
+
         # Position categories dynamically based on what's used
         if used_categories:
             spacing = 8 / len(used_categories)
             start_x = spacing / 2 + 1
-            
+
             for i, (name, color) in enumerate(used_categories):
                 x = start_x + i * spacing
                 x_positions.append(x)
-                
-                box = FancyBboxPatch((x-0.8, 4.2), 1.6, 1.0,
-                                   boxstyle="round,pad=0.05",
-                                   facecolor=color, edgecolor='gray')
-                ax.add_patch(box)
-                ax.text(x, 4.7, name, fontsize=11, ha='center', va='center', fontweight='bold')
-        
+                box(x - 1.2, 4.2, 2.4, 1.0, color, colors.gray, radius=4)
+                text(x, 4.6, name, 8, bold=True)
+
         # Show details for active compute resources
         if self.linodes and used_categories:
             compute_x = x_positions[0]
             y_pos = 3.8
-            
+
             # Group by instance type and show costs
-            type_counts = {}
-            for linode in self.linodes:
-                instance_type = linode.get('type', 'Unknown')
-                type_counts[instance_type] = type_counts.get(instance_type, 0) + 1
-            
-            for instance_type, count in type_counts.items():
-                unit_cost = self.get_instance_cost(instance_type)
-                total_cost = unit_cost * count
-                if count > 1:
-                    ax.text(compute_x, y_pos, f"{count}x {instance_type}", fontsize=9, ha='center', fontweight='bold')
-                    y_pos -= 0.25
-                    ax.text(compute_x, y_pos, f"${total_cost:.2f}/mo", fontsize=9, ha='center', color=accent)
-                else:
-                    ax.text(compute_x, y_pos, f"{instance_type}", fontsize=9, ha='center', fontweight='bold')
-                    y_pos -= 0.25
-                    ax.text(compute_x, y_pos, f"${unit_cost:.2f}/mo", fontsize=9, ha='center', color=accent)
+            for instance_type, count in self.linode_type_counts.items():
+                label = f"{count}x {instance_type}" if count > 1 else instance_type
+                text(compute_x, y_pos, label, 7, bold=True)
+                y_pos -= 0.25
+                text(compute_x, y_pos, f"${instance_cost(instance_type) * count:.2f}/mo", 7, color=accent)
                 y_pos -= 0.3
-        
+
         # Show LKE details if clusters exist
         if self.lke_clusters and len(used_categories) > 1:
             lke_x = x_positions[1]
             y_pos = 3.8
-            
-            ax.text(lke_x, y_pos, "Control Plane: Free", fontsize=9, ha='center', fontweight='bold')
+
+            text(lke_x, y_pos, "Control Plane: Free", 7, bold=True)
             y_pos -= 0.25
-            
+
             # Show worker node costs
-            total_worker_cost = 0
             for cluster in self.lke_clusters:
                 for pool in cluster.get('pools', []):
                     pool_type = pool.get('type', 'g6-standard-2')
                     pool_count = pool.get('count', 0)
-                    pool_cost = self.get_instance_cost(pool_type) * pool_count
-                    total_worker_cost += pool_cost
-                    
                     if pool_count > 0:
-                        ax.text(lke_x, y_pos, f"{pool_count}x {pool_type} workers", fontsize=9, ha='center')
+                        text(lke_x, y_pos, f"{pool_count}x {pool_type} workers", 7)
                         y_pos -= 0.2
-                        ax.text(lke_x, y_pos, f"${pool_cost:.2f}/mo", fontsize=9, ha='center', color=accent)
+                        text(lke_x, y_pos, f"${instance_cost(pool_type) * pool_count:.2f}/mo", 7, color=accent)
                         y_pos -= 0.3
-        
+
         # Total monthly estimate for used resources
-        if self.linodes or self.lke_clusters:
-            total_monthly = 0
-            
-            # Add compute costs
-            for linode in self.linodes:
-                total_monthly += self.get_instance_cost(linode.get('type', ''))
-                
-            # Add LKE worker node costs
-            for cluster in self.lke_clusters:
-                for pool in cluster.get('pools', []):
-                    pool_type = pool.get('type', 'g6-standard-2')
-                    pool_count = pool.get('count', 0)
-                    total_monthly += self.get_instance_cost(pool_type) * pool_count
-            
-            if total_monthly > 0:
-                estimate_box = FancyBboxPatch((2, 1), 6, 1,
-                                            boxstyle="round,pad=0.1",
-                                            facecolor='lightyellow',
-                                            edgecolor=accent, linewidth=2)
-                ax.add_patch(estimate_box)
-                ax.text(5, 1.7, 'Current Resources Monthly Cost', fontsize=12, fontweight='bold', ha='center')
-                ax.text(5, 1.3, f'${total_monthly:.2f}/month', fontsize=14, fontweight='bold', ha='center', color=accent)
-        else:
-            # No active resources
-            ax.text(5, 3, 'No active billable resources this month', fontsize=14, ha='center', style='italic', color='gray')
-        
-        # Save diagram
-        diagram_file = self.report_dir / "cost_structure.png"
-        plt.tight_layout()
-        plt.savefig(diagram_file, dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close()
-        
-        return str(diagram_file)
+        if self.total_monthly > 0:
+            box(2, 1, 6, 1, colors.lightyellow, accent, stroke_width=2)
+            text(5, 1.6, 'Current Resources Monthly Cost', 9, bold=True)
+            text(5, 1.2, f'${self.total_monthly:.2f}/month', 10, bold=True, color=accent)
+
+        return drawing
 
-    def create_resource_chart(self) -> str:
+    def _prune_charts(self):
+        """Remove cached chart renders that have not been used recently."""
+        cutoff = time.time() - CHART_MAX_AGE_DAYS * 24 * 60 * 60
+        for chart_file in self.report_dir.glob("resource_chart.*.png"):
+            try:
+                if chart_file.stat().st_mtime < cutoff:
+                    chart_file.unlink()
+            except OSError:
+                pass
+
+    def create_resource_chart(self) -> Optional[str]:
         """Create a pie chart of resource types."""
-        if not self.linodes:
+        # A single instance type would just be a full circle labeled 100%
+        if len(self.linode_type_counts) <= 1:
             return None
             
-        # Count instance types
-        type_counts = {}
-        for linode in self.linodes:
-            instance_type = linode.get('type', 'Unknown')
-            type_counts[instance_type] = type_counts.get(instance_type, 0) + 1
-        
+        # The chart only depends on the type counts, so reuse an earlier render of the same data
+        key = hashlib.blake2b(json.dumps(list(self.linode_type_counts.items())).encode(),
+                              digest_size=8).hexdigest()
+        chart_file = self.report_dir / f"resource_chart.{key}.png"
+        self._prune_charts()
+        if chart_file.exists():
+            chart_file.touch()
+            return str(chart_file)
+
+        plt = _pyplot()
         fig, ax = plt.subplots(figsize=(8, 6))
         
-        labels = list(type_counts.keys())
-        sizes = list(type_counts.values())
-        colors = plt.cm.Set3(np.linspace(0, 1, len(labels)))
+        labels = list(self.linode_type_counts.keys())
+        sizes = list(self.linode_type_counts.values())
+        colors = [_SET3[i % len(_SET3)] for i in range(len(labels))]
         
         wedges, texts, autotexts = ax.pie(sizes, labels=labels, autopct='%1.0f%%',
                                          colors=colors, startangle=90)
         
         ax.set_title('Resource Distribution by Instance Type', fontsize=14, fontweight='bold')
         
-        # Save chart
-        chart_file = self.report_dir / "resource_chart.png"
-        plt.tight_layout()
-        plt.savefig(chart_file, dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close()
+        # Write to a temporary name first so an interrupted render is never reused
+        tmp_file = f"{chart_file}.tmp"
+        fig.savefig(tmp_file, format='png', dpi=150, bbox_inches='tight', facecolor='white',
+                    pil_kwargs={"optimize": False, "compress_level": 1})
+        plt.close(fig)
+        os.replace(tmp_file, chart_file)
         
         return str(chart_file)
 
     def generate_pdf(self):
         """Generate the PDF report."""
+        from reportlab.lib.colors import HexColor
+        from reportlab.lib.enums import TA_CENTER
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Image
+
         print("📄 Generating PDF report...")
         
         doc = SimpleDocTemplate(str(self.pdf_file), pagesize=A4,
                               topMargin=1*inch, bottomMargin=1*inch,
-                              leftMargin=0.75*inch, rightMargin=0.75*inch)
+                              leftMargin=0.75*inch, rightMargin=0.75*inch,
+                              pageCompression=1)
         
         # Styles
         styles = getSampleStyleSheet()
@@ -303,7 +480,7 @@ class LinodeBillingReport:
             'CustomTitle',
             parent=styles['Heading1'],
             fontSize=24,
-            textColor=self.primary_color,
+            textColor=HexColor(self.primary_color),
             spaceAfter=30,
             alignment=TA_CENTER
         )
@@ -312,7 +489,7 @@ class LinodeBillingReport:
             'CustomHeading',
             parent=styles['Heading2'],
             fontSize=16,
-            textColor=self.secondary_color,
+            textColor=HexColor(self.secondary_color),
             spaceBefore=20,
             spaceAfter=10
         )
@@ -321,35 +498,33 @@ class LinodeBillingReport:
         story = []
         
         # Title page
-        story.append(Paragraph("Linode Infrastructure Billing Report", title_style))
-        story.append(Spacer(1, 0.5*inch))
+        story.extend([
+            Paragraph("Linode Infrastructure Billing Report", title_style),
+            Spacer(1, 0.5*inch),
+        ])
         
         # Account info
         account_data = [
             ['Account', self.account_info.get('email', 'N/A')],
-            ['Report Date', datetime.now().strftime('%B %d, %Y at %H:%M %Z')],
+            ['Report Date', self.report_date_str],
             ['Balance', f"${self.account_info.get('balance', '0')}"],
             ['Uninvoiced Usage', f"${self.account_info.get('balance_uninvoiced', '0')}"],
             ['Total Due', f"${float(self.account_info.get('balance', 0)) + float(self.account_info.get('balance_uninvoiced', 0)):.2f}"]
         ]
         
         account_table = Table(account_data, colWidths=[2*inch, 3*inch])
-        account_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), self.primary_color),
-            ('TEXTCOLOR', (0, 0), (-1, 0), 'white'),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        account_table.setStyle(_make_table_style(
+            HexColor(self.primary_color), 'lightgrey',
             ('FONTSIZE', (0, 0), (-1, 0), 12),
             ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), 'lightgrey'),
-            ('GRID', (0, 0), (-1, -1), 1, 'black')
-        ]))
-        
-        story.append(account_table)
-        story.append(Spacer(1, 0.3*inch))
+        ))
         
         # Executive Summary
-        story.append(Paragraph("Executive Summary", heading_style))
+        story.extend([
+            account_table,
+            Spacer(1, 0.3*inch),
+            Paragraph("Executive Summary", heading_style),
+        ])
         
         summary_data = [
             ['Metric', 'Value'],
@@ -359,105 +534,90 @@ class LinodeBillingReport:
         ]
         
         if self.linodes:
-            total_monthly = sum(self.get_instance_cost(l.get('type', '')) for l in self.linodes)
-            summary_data.append(['Est. Monthly Compute Cost', f"${total_monthly:.2f}"])
+            summary_data.append(['Est. Monthly Compute Cost', f"${self.linode_monthly:.2f}"])
         
         summary_table = Table(summary_data, colWidths=[3*inch, 2*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), self.secondary_color),
-            ('TEXTCOLOR', (0, 0), (-1, 0), 'white'),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        summary_table.setStyle(_make_table_style(
+            HexColor(self.secondary_color), HexColor('#E3F2FD'),
             ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('GRID', (0, 0), (-1, -1), 1, 'black'),
-            ('BACKGROUND', (0, 1), (-1, -1), HexColor('#E3F2FD'))
-        ]))
+        ))
         
-        story.append(summary_table)
-        story.append(Spacer(1, 0.3*inch))
+        story.extend([summary_table, Spacer(1, 0.3*inch)])
         
         # Cost Structure Diagram
-        diagram_file = self.create_cost_structure_diagram()
-        if diagram_file and Path(diagram_file).exists():
-            story.append(Paragraph("Cost Structure Analysis", heading_style))
-            story.append(Image(diagram_file, width=6*inch, height=4*inch))
-            story.append(Spacer(1, 0.2*inch))
+        if not self.skip_charts:
+            cost_drawing = self._build_cost_drawing()
+            if cost_drawing is None:
+                cost_drawing = Paragraph("<i>No active billable resources this month</i>", styles['Normal'])
+            story.extend([
+                Paragraph("Cost Structure Analysis", heading_style),
+                cost_drawing,
+                Spacer(1, 0.2*inch),
+            ])
         
         # Active Resources
         story.append(Paragraph("Active Compute Resources", heading_style))
         
         if self.linodes:
             resource_data = [['Instance', 'Type', 'Region', 'Status', 'Est. Monthly Cost']]
-            for linode in self.linodes:
-                cost = self.get_instance_cost(linode.get('type', ''))
-                resource_data.append([
-                    linode.get('label', 'Unknown'),
-                    linode.get('type', 'Unknown'),
-                    linode.get('region', 'Unknown'),
-                    linode.get('status', 'Unknown'),
-                    f"${cost:.2f}"
-                ])
+            resource_data.extend([
+                linode.get('label', 'Unknown'),
+                linode.get('type', 'Unknown'),
+                linode.get('region', 'Unknown'),
+                linode.get('status', 'Unknown'),
+                f"${instance_cost(linode.get('type', '')):.2f}"
+            ] for linode in self.linodes)
             
             resource_table = Table(resource_data, colWidths=[1.5*inch, 1.2*inch, 1.2*inch, 1*inch, 1.1*inch])
-            resource_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), self.accent_color),
-                ('TEXTCOLOR', (0, 0), (-1, 0), 'white'),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            resource_table.setStyle(_make_table_style(
+                HexColor(self.accent_color), HexColor('#F0F0F0'),
                 ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('GRID', (0, 0), (-1, -1), 1, 'black'),
-                ('BACKGROUND', (0, 1), (-1, -1), HexColor('#F0F0F0'))
-            ]))
+            ))
             
             story.append(resource_table)
         else:
             story.append(Paragraph("✅ No active compute instances", styles['Normal']))
         
-        story.append(Spacer(1, 0.3*inch))
-        
         # Kubernetes Clusters
-        story.append(Paragraph("Kubernetes Infrastructure", heading_style))
+        story.extend([
+            Spacer(1, 0.3*inch),
+            Paragraph("Kubernetes Infrastructure", heading_style),
+        ])
         
         if self.lke_clusters:
             lke_data = [['Cluster', 'Version', 'Region', 'Node Pools']]
-            for cluster in self.lke_clusters:
-                pools_info = []
-                for pool in cluster.get('pools', []):
-                    pools_info.append(f"{pool.get('count', 0)}x {pool.get('type', 'unknown')}")
-                pools_str = ", ".join(pools_info) if pools_info else "No pools"
-                
-                lke_data.append([
-                    cluster.get('label', 'Unknown'),
-                    cluster.get('k8s_version', 'Unknown'),
-                    cluster.get('region', 'Unknown'),
-                    pools_str
-                ])
+            lke_data.extend([
+                cluster.get('label', 'Unknown'),
+                cluster.get('k8s_version', 'Unknown'),
+                cluster.get('region', 'Unknown'),
+                ", ".join(f"{pool.get('count', 0)}x {pool.get('type', 'unknown')}"
+                          for pool in cluster.get('pools', [])) or "No pools"
+            ] for cluster in self.lke_clusters)
             
             lke_table = Table(lke_data, colWidths=[1.5*inch, 1.2*inch, 1.2*inch, 2.1*inch])
-            lke_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), self.secondary_color),
-                ('TEXTCOLOR', (0, 0), (-1, 0), 'white'),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            lke_table.setStyle(_make_table_style(
+                HexColor(self.secondary_color), HexColor('#E8F5E8'),
                 ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('GRID', (0, 0), (-1, -1), 1, 'black'),
-                ('BACKGROUND', (0, 1), (-1, -1), HexColor('#E8F5E8'))
-            ]))
+            ))
             
             story.append(lke_table)
         else:
             story.append(Paragraph("✅ No active Kubernetes clusters", styles['Normal']))
         
         # Resource distribution chart
-        chart_file = self.create_resource_chart()
+        chart_file = None if self.skip_charts else self.create_resource_chart()
         if chart_file and Path(chart_file).exists():
-            story.append(Spacer(1, 0.3*inch))
-            story.append(Paragraph("Resource Distribution", heading_style))
-            story.append(Image(chart_file, width=4*inch, height=3*inch))
+            story.extend([
+                Spacer(1, 0.3*inch),
+                Paragraph("Resource Distribution", heading_style),
+                Image(chart_file, width=4*inch, height=3*inch),
+            ])
         
         # Cost optimization recommendations
-        story.append(Spacer(1, 0.3*inch))
-        story.append(Paragraph("Cost Optimization Recommendations", heading_style))
+        story.extend([
+            Spacer(1, 0.3*inch),
+            Paragraph("Cost Optimization Recommendations", heading_style),
+        ])
         
         recommendations = [
             "• Review instance sizing - ensure resources match actual usage patterns",
@@ -468,9 +628,8 @@ class LinodeBillingReport:
             "• Regular cleanup of unused volumes, snapshots, and networking resources"
         ]
         
-        for rec in recommendations:
-            story.append(Paragraph(rec, styles['Normal']))
-            story.append(Spacer(1, 0.1*inch))
+        story.extend(chain.from_iterable(
+            (Paragraph(rec, styles['Normal']), Spacer(1, 0.1*inch)) for rec in recommendations))
         
         # Build PDF
         doc.build(story)
@@ -506,5 +665,13 @@ class LinodeBillingReport:
             sys.exit(1)
 
 if __name__ == "__main__":
-    generator = LinodeBillingReport()
+    parser = argparse.ArgumentParser(description="Generate a Linode infrastructure billing report.")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore cached linode-cli responses (also set via BILLING_NO_CACHE)")
+    parser.add_argument("--skip-charts", action="store_true",
+                        help="Leave out the diagram and chart for a faster tables-only report "
+                             "(also set via BILLING_SKIP_CHARTS)")
+    args = parser.parse_args()
+
+    generator = LinodeBillingReport(use_cache=not args.no_cache, skip_charts=args.skip_charts)
     generator.run()
\ No newline at end of file